@@ -1,17 +1,94 @@
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import datetime, date, time, timezone, timedelta
 
-from fastapi import FastAPI, HTTPException, Depends
+import hashlib
+import re
+import time as time_mod
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pathlib import Path
 
+from sqlalchemy import Column, DateTime, ForeignKey, Index, UniqueConstraint, bindparam, case, delete, event, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import QueuePool
 from sqlmodel import SQLModel, Field, create_engine, Session, select, Relationship
 
 
 DATABASE_URL = "sqlite:///./calendar.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Read-only URI so GET traffic can fan out over a pool without ever taking
+# the single SQLite write lock.
+READ_DATABASE_URL = "sqlite:///file:./calendar.db?mode=ro&uri=true"
+
+write_engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": 5},
+    poolclass=QueuePool,
+    pool_size=1,
+    max_overflow=0,
+    query_cache_size=1200,
+)
+read_engine = create_engine(
+    READ_DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": 5},
+    poolclass=QueuePool,
+    pool_size=8,
+    query_cache_size=1200,
+)
+
+
+def configure_write_engine(engine):
+    """Attach the write-side pragmas and IMMEDIATE transaction handling.
+
+    Shared with reset_db.py / sync_users.py so every writer to calendar.db
+    gets the same WAL tuning and lock behaviour.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_write_pragmas(dbapi_conn, _connection_record):
+        # WAL lets readers run concurrently with a writer; NORMAL sync is safe
+        # in WAL mode and avoids an fsync per commit. Negative cache_size is KiB.
+        dbapi_conn.isolation_level = None  # transactions are driven by the "begin" hook
+        cur = dbapi_conn.cursor()
+        cur.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA busy_timeout=5000;"
+            "PRAGMA cache_size=-20000;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA foreign_keys=ON;"
+        )
+        cur.close()
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(conn):
+        # Take the write lock up front; a deferred BEGIN that later upgrades
+        # to a write can deadlock against other writers.
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+configure_write_engine(write_engine)
+
+
+@event.listens_for(read_engine, "connect")
+def _set_read_pragmas(dbapi_conn, _connection_record):
+    # journal_mode is a property of the database file and is already set by
+    # the write engine; a read-only connection cannot change it.
+    cur = dbapi_conn.cursor()
+    cur.executescript(
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA busy_timeout=5000;"
+        "PRAGMA cache_size=-20000;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA foreign_keys=ON;"
+    )
+    cur.close()
 
 
 class User(SQLModel, table=True):
@@ -20,10 +97,13 @@ class User(SQLModel, table=True):
     type: str
     role: str
     active: bool
-    responses: List["EventResponse"] = Relationship(back_populates="user")
+    responses: List["EventResponse"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class Event(SQLModel, table=True):
+    # Indexed for future date-range queries
+    __table_args__ = (Index("ix_event_date", "date"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     description: str
@@ -33,35 +113,48 @@ class Event(SQLModel, table=True):
     event_type_id: Optional[int] = Field(default=None, foreign_key="eventtype.id")
     location: Optional[str] = None
     link: Optional[str] = None
-    # relationship (optional for ORM use)
-    event_type: Optional["EventType"] = Relationship(back_populates="events")
-    responses: List["EventResponse"] = Relationship(back_populates="event")
+    # Relationships are lazy="raise": handlers must opt in to loading them
+    # explicitly (selectinload / batch queries) so N+1 regressions fail fast.
+    event_type: Optional["EventType"] = Relationship(back_populates="events", sa_relationship_kwargs={"lazy": "raise"})
+    responses: List["EventResponse"] = Relationship(back_populates="event", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class EventType(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    name: str
+    name: str = Field(index=True, unique=True)
     color: Optional[str] = None
-    events: List[Event] = Relationship(back_populates="event_type")
+    events: List[Event] = Relationship(back_populates="event_type", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class EventResponse(SQLModel, table=True):
+    # One response per (event, user); the index covers the per-event filters
+    # used by the response endpoints.
+    __table_args__ = (
+        UniqueConstraint("event_id", "user_id", name="uq_resp_event_user"),
+        # (event_id, id) lets the keyset pager terminate early on the index
+        Index("ix_resp_event", "event_id", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="user.id")
-    event_id: int = Field(foreign_key="event.id")
+    # ON DELETE CASCADE: removing an event or user cleans up its responses
+    # inside the same DELETE statement (foreign_keys=ON is set per connection)
+    user_id: int = Field(sa_column=Column(ForeignKey("user.id", ondelete="CASCADE"), nullable=False))
+    event_id: int = Field(sa_column=Column(ForeignKey("event.id", ondelete="CASCADE"), nullable=False))
     status: str  # "Yes", "No", or "Maybe"
     note: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Timestamps come from SQLite (CURRENT_TIMESTAMP) rather than Python
+    created_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime, server_default=func.now(), nullable=False))
+    updated_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False))
 
     # relationships
-    user: Optional[User] = Relationship(back_populates="responses")
-    event: Optional[Event] = Relationship(back_populates="responses")
+    user: Optional[User] = Relationship(back_populates="responses", sa_relationship_kwargs={"lazy": "raise"})
+    event: Optional[Event] = Relationship(back_populates="responses", sa_relationship_kwargs={"lazy": "raise"})
 
 
 class EventResponseCreate(SQLModel):
     user_id: int
-    status: str  # "Yes", "No", or "Maybe"
+    # Pydantic rejects anything else with a 422 before the handler runs
+    status: Literal["Yes", "No", "Maybe"]
     note: Optional[str] = None
 
 
@@ -94,12 +187,53 @@ class EventRead(SQLModel):
     link: Optional[str] = None
 
 
-app = FastAPI(title="Calendar Management Backend")
+# Hot statements hoisted to module scope so the compiled SQL is built once
+# and reused (together with query_cache_size on the engines).
+_SEL_RESP_BY_EVENT = select(EventResponse).where(EventResponse.event_id == bindparam("eid"))
+_SEL_RESP_PAGE = (
+    select(EventResponse)
+    .where(EventResponse.event_id == bindparam("eid"), EventResponse.id > bindparam("after"))
+    .order_by(EventResponse.id)
+    .limit(bindparam("lim"))
+)
+_SEL_ET_BY_NAME = select(EventType).where(EventType.name == bindparam("name"))
+# All five summary counts in one scan of the event's responses
+_SEL_RESP_SUMMARY = (
+    select(
+        func.sum(case((EventResponse.status == "Yes", 1), else_=0)).label("yes"),
+        func.sum(case((EventResponse.status == "No", 1), else_=0)).label("no"),
+        func.sum(case((EventResponse.status == "Maybe", 1), else_=0)).label("maybe"),
+        func.sum(case(((EventResponse.status == "Yes") & (User.type == "mentor"), 1), else_=0)).label("mentors"),
+        func.sum(case(((EventResponse.status == "Yes") & (User.type == "student"), 1), else_=0)).label("students"),
+    )
+    .join(User, User.id == EventResponse.user_id)
+    .where(EventResponse.event_id == bindparam("eid"))
+)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Create schema on the write engine before the read-only engine first
+    # connects, then prime one pooled connection per engine so the first
+    # request does not pay the database file-open cost.
+    SQLModel.metadata.create_all(write_engine)
+    with write_engine.connect():
+        pass
+    with read_engine.connect():
+        pass
+    yield
+
+
+# orjson serializes several times faster than the stdlib json encoder
+app = FastAPI(title="Calendar Management Backend", lifespan=lifespan, default_response_class=ORJSONResponse)
 origins = [
     "*"
     # add other origins you need (or use "*" for development)
 ]
 
+# Compress JSON and static payloads above half a KiB
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,        # or ["*"] for dev
@@ -108,136 +242,162 @@ app.add_middleware(
     allow_headers=["*"],          # allow Content-Type and other headers
 )
 
-# Serve frontend assets and index (works when running with uvicorn)
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks hashed build artifacts as immutable.
+
+    Vite emits content-hashed names (e.g. index-B2g9MJqV.js), so those files
+    can be cached for a year; a new build changes the name, not the content.
+    """
+
+    _hashed_name = re.compile(r"-[A-Za-z0-9_-]{8,}\.(?:js|css)$")
+
+    def file_response(self, full_path, *args, **kwargs):
+        resp = super().file_response(full_path, *args, **kwargs)
+        if self._hashed_name.search(str(full_path)):
+            resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return resp
+
+
+# Serve frontend assets and index (works when running with uvicorn).
+# Existence is resolved once at import so the handlers skip the per-request
+# stat() call; routes are only registered for files that are present.
 frontend_dir = Path(__file__).resolve().parent / "frontend"
-index_file = frontend_dir / "index.html"
 if frontend_dir.exists():
     assets_dir = frontend_dir / "assets"
     if assets_dir.exists():
-        app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
+        app.mount("/assets", CachedStaticFiles(directory=str(assets_dir)), name="assets")
+
+    index_file = frontend_dir / "index.html"
+    if index_file.exists():
+        _index_path = str(index_file)
 
-    @app.get("/", include_in_schema=False)
-    def serve_frontend_index():
-        if index_file.exists():
-            return FileResponse(str(index_file))
-        raise HTTPException(status_code=404, detail="Frontend index not found")
+        @app.get("/", include_in_schema=False)
+        def serve_frontend_index():
+            return FileResponse(_index_path, headers={"Cache-Control": "public, max-age=3600"})
 
     # Serve top-level static files from frontend (e.g., logo.png)
     logo_file = frontend_dir / "logo.png"
+    if logo_file.exists():
+        _logo_path = str(logo_file)
 
-    @app.get("/logo.png", include_in_schema=False)
-    def serve_logo():
-        if logo_file.exists():
-            return FileResponse(str(logo_file))
-        raise HTTPException(status_code=404, detail="logo.png not found")
+        @app.get("/logo.png", include_in_schema=False)
+        def serve_logo():
+            return FileResponse(_logo_path, headers={"Cache-Control": "public, max-age=3600"})
 
 
-@app.on_event("startup")
-def on_startup():
-    # Create fresh schema; assume database will be recreated externally
-    SQLModel.metadata.create_all(engine)
+def get_read_session():
+    with Session(read_engine) as session:
+        yield session
 
 
-def get_session():
-    with Session(engine) as session:
+def get_write_session():
+    with Session(write_engine) as session:
         yield session
 
 
-@app.post("/events/{event_id}/responses", response_model=EventResponse)
-def create_or_update_response(event_id: int, resp_in: EventResponseCreate, session: Session = Depends(get_session)):
-    # Ensure event exists
-    event = session.get(Event, event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
+# Event types are tiny and essentially static, so resolve them from process
+# memory. Both caches are cleared when a new type is created.
+@lru_cache(maxsize=128)
+def _event_type_by_id(et_id: int) -> Optional[tuple]:
+    """Return (id, name, color) for an event type id, or None."""
+    with Session(read_engine) as session:
+        et = session.get(EventType, et_id)
+        return (et.id, et.name, et.color) if et else None
 
-    # Ensure user exists
-    user = session.get(User, resp_in.user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
 
-    # Validate status
-    if resp_in.status not in ["Yes", "No", "Maybe"]:
-        raise HTTPException(status_code=400, detail="status must be 'Yes', 'No', or 'Maybe'")
+@lru_cache(maxsize=128)
+def _event_type_by_name(name: str) -> Optional[tuple]:
+    """Return (id, name, color) for an event type name, or None."""
+    with Session(read_engine) as session:
+        et = session.exec(_SEL_ET_BY_NAME, params={"name": name}).first()
+        return (et.id, et.name, et.color) if et else None
 
-    # Check for existing response by this user for this event
-    stmt = select(EventResponse).where((EventResponse.event_id == event_id) & (EventResponse.user_id == resp_in.user_id))
-    existing = session.exec(stmt).first()
-    if existing:
-        existing.status = resp_in.status
-        existing.note = resp_in.note
-        existing.updated_at = datetime.now(timezone.utc)
-        session.add(existing)
-        session.commit()
-        session.refresh(existing)
-        return existing
 
-    resp = EventResponse(user_id=resp_in.user_id, event_id=event_id, status=resp_in.status, note=resp_in.note, created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc))
-    session.add(resp)
-    session.commit()
+@app.post("/events/{event_id}/responses", response_model=EventResponse)
+def create_or_update_response(event_id: int, resp_in: EventResponseCreate, session: Session = Depends(get_write_session)):
+    # One UPSERT instead of existence checks + SELECT + INSERT/UPDATE; the
+    # foreign keys reject unknown event/user ids and the unique
+    # (event_id, user_id) constraint routes repeats to the UPDATE branch.
+    # Timestamps are filled in by the database.
+    stmt = (
+        sqlite_insert(EventResponse)
+        .values(user_id=resp_in.user_id, event_id=event_id, status=resp_in.status, note=resp_in.note)
+        .on_conflict_do_update(
+            index_elements=["event_id", "user_id"],
+            set_={"status": resp_in.status, "note": resp_in.note, "updated_at": func.now()},
+        )
+        .returning(EventResponse)
+    )
+    try:
+        resp = session.exec(stmt).scalars().one()
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        raise HTTPException(status_code=404, detail="Event or user not found")
     session.refresh(resp)
     return resp
 
 
-@app.get("/events/{event_id}/responses", response_model=List[EventResponse])
-def list_responses(event_id: int, session: Session = Depends(get_session)):
+@app.get("/events/{event_id}/responses")
+def list_responses(
+    event_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    after_id: Optional[int] = None,
+    session: Session = Depends(get_read_session),
+):
+    """Responses for an event.
+
+    Without query params this returns the plain array the shipped frontend
+    expects. Pass `limit` (and `after_id` from the previous page's
+    `next_cursor`) to opt into keyset pagination, which returns
+    {items, next_cursor}; `next_cursor` is null on the last page.
+    """
     event = session.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    responses = session.exec(select(EventResponse).where(EventResponse.event_id == event_id)).all()
-    return responses
+    if limit is None and after_id is None:
+        return session.exec(_SEL_RESP_BY_EVENT, params={"eid": event_id}).all()
+    lim = limit or 100
+    items = session.exec(_SEL_RESP_PAGE, params={"eid": event_id, "after": after_id or 0, "lim": lim}).all()
+    return {
+        "items": items,
+        "next_cursor": items[-1].id if items and len(items) == lim else None,
+    }
 
 
 @app.delete("/events/{event_id}/responses/{user_id}")
-def delete_response(event_id: int, user_id: int, session: Session = Depends(get_session)):
-    # Ensure event exists
-    event = session.get(Event, event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    
-    # Find the response
-    stmt = select(EventResponse).where((EventResponse.event_id == event_id) & (EventResponse.user_id == user_id))
-    response = session.exec(stmt).first()
-    if not response:
+def delete_response(event_id: int, user_id: int, session: Session = Depends(get_write_session)):
+    # DELETE ... RETURNING: one statement instead of a lookup plus a delete
+    deleted = session.exec(
+        delete(EventResponse)
+        .where((EventResponse.event_id == event_id) & (EventResponse.user_id == user_id))
+        .returning(EventResponse.id)
+    ).first()
+    if not deleted:
         raise HTTPException(status_code=404, detail="Response not found")
-    
-    session.delete(response)
     session.commit()
     return {"ok": True}
 
 
 @app.get("/events/{event_id}/responses/summary")
-def responses_summary(event_id: int, session: Session = Depends(get_session)):
+def responses_summary(event_id: int, session: Session = Depends(get_read_session)):
     event = session.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    responses = session.exec(select(EventResponse).where(EventResponse.event_id == event_id)).all()
-    yes_count = sum(1 for r in responses if r.status == "Yes")
-    no_count = sum(1 for r in responses if r.status == "No")
-    maybe_count = sum(1 for r in responses if r.status == "Maybe")
-    
-    # Count mentors and students attending (status == "Yes")
-    mentor_count = 0
-    student_count = 0
-    for r in responses:
-        if r.status == "Yes":
-            user = session.get(User, r.user_id)
-            if user:
-                if user.type == "mentor":
-                    mentor_count += 1
-                elif user.type == "student":
-                    student_count += 1
-    
+    # Single CASE WHEN aggregate: SQLite computes all five counts in one
+    # sequential scan of the event's (indexed) responses.
+    row = session.exec(_SEL_RESP_SUMMARY, params={"eid": event_id}).one()
     return {
-        "yes": yes_count,
-        "no": no_count,
-        "maybe": maybe_count,
-        "mentors_attending": mentor_count,
-        "students_attending": student_count
+        "yes": row.yes or 0,
+        "no": row.no or 0,
+        "maybe": row.maybe or 0,
+        "mentors_attending": row.mentors or 0,
+        "students_attending": row.students or 0
     }
 
 
 @app.post("/users", response_model=User)
-def create_user(user: User, session: Session = Depends(get_session)):
+def create_user(user: User, session: Session = Depends(get_write_session)):
     session.add(user)
     session.commit()
     session.refresh(user)
@@ -245,23 +405,23 @@ def create_user(user: User, session: Session = Depends(get_session)):
 
 
 @app.get("/users", response_model=List[User])
-def list_users(session: Session = Depends(get_session)):
+def list_users(session: Session = Depends(get_read_session)):
     users = session.exec(select(User)).all()
     return users
 
 
 @app.delete("/users/{user_id}")
-def delete_user(user_id: int, session: Session = Depends(get_session)):
-    user = session.get(User, user_id)
-    if not user:
+def delete_user(user_id: int, session: Session = Depends(get_write_session)):
+    deleted = session.exec(delete(User).where(User.id == user_id).returning(User.id)).first()
+    if not deleted:
         raise HTTPException(status_code=404, detail="User not found")
-    session.delete(user)
     session.commit()
     return {"ok": True}
 
 
 @app.post("/events", response_model=EventRead)
-def create_event(event_in: EventCreate, session: Session = Depends(get_session)):
+def create_event(event_in: EventCreate, response: Response, session: Session = Depends(get_write_session)):
+    response.headers["Cache-Control"] = "no-cache"
     # Parse/validate date, start_time and duration
     if event_in.date is None or event_in.start_time is None or event_in.duration_minutes is None:
         raise HTTPException(status_code=400, detail="`date`, `start_time`, and `duration_minutes` are required")
@@ -289,67 +449,84 @@ def create_event(event_in: EventCreate, session: Session = Depends(get_session))
     if event_in.duration_minutes <= 0:
         raise HTTPException(status_code=400, detail="`duration_minutes` must be a positive integer")
 
-    # Resolve or create event type
+    # Resolve event type from the process-memory cache
     et_id = None
+    type_name = None
+    type_color = None
     if event_in.event_type_id is not None:
-        et = session.get(EventType, event_in.event_type_id)
+        et = _event_type_by_id(event_in.event_type_id)
         if not et:
             raise HTTPException(status_code=400, detail="event_type_id not found")
-        et_id = et.id
+        et_id, type_name, type_color = et
     elif event_in.event_type:
-        stmt = select(EventType).where(EventType.name == event_in.event_type)
-        et = session.exec(stmt).first()
+        et = _event_type_by_name(event_in.event_type)
         if not et:
             # Do not auto-create types; require the frontend to create via /event-types
             raise HTTPException(status_code=400, detail="event_type not found; create it via /event-types first")
-        et_id = et.id
+        et_id, type_name, type_color = et
 
     event = Event(title=event_in.title, description=event_in.description, date=event_in.date, start_time=event_in.start_time, duration_minutes=event_in.duration_minutes, event_type_id=et_id, location=event_in.location, link=event_in.link)
     session.add(event)
     session.commit()
     session.refresh(event)
 
-    # Build response with resolved type name
-    type_name = None
-    type_color = None
-    if event.event_type_id:
-        et = session.get(EventType, event.event_type_id)
-        type_name = et.name if et else None
-        type_color = et.color if et else None
+    # Type name/color were already resolved above; no extra query needed
     return EventRead(id=event.id, title=event.title, description=event.description, date=event.date, start_time=event.start_time, duration_minutes=event.duration_minutes, event_type_id=event.event_type_id, event_type_name=type_name, event_type_color=type_color, location=event.location, link=event.link)
 
 
-@app.get("/events", response_model=List[EventRead])
-def list_events(session: Session = Depends(get_session)):
+@app.get("/events", response_class=ORJSONResponse)
+def list_events(request: Request, session: Session = Depends(get_read_session)):
     events = session.exec(select(Event)).all()
-    out: List[EventRead] = []
+    # One IN query for all referenced types; unlike the per-id cache this is
+    # a single round trip even when the cache is cold.
+    ids = {ev.event_type_id for ev in events if ev.event_type_id}
+    et_map = {}
+    if ids:
+        et_map = {et.id: et for et in session.exec(select(EventType).where(EventType.id.in_(ids))).all()}
+    # Plain dicts straight into orjson; skips per-item Pydantic validation
+    out = []
     for ev in events:
-        type_name = None
-        type_color = None
-        if ev.event_type_id:
-            et = session.get(EventType, ev.event_type_id)
-            type_name = et.name if et else None
-            type_color = et.color if et else None
-        out.append(EventRead(id=ev.id, title=ev.title, description=ev.description, date=ev.date, start_time=ev.start_time, duration_minutes=ev.duration_minutes, event_type_id=ev.event_type_id, event_type_name=type_name, event_type_color=type_color, location=ev.location, link=ev.link))
-    return out
+        et = et_map.get(ev.event_type_id)
+        out.append({
+            "id": ev.id,
+            "title": ev.title,
+            "description": ev.description,
+            "date": ev.date,
+            "start_time": ev.start_time,
+            "duration_minutes": ev.duration_minutes,
+            "event_type_id": ev.event_type_id,
+            "event_type_name": et.name if et else None,
+            "event_type_color": et.color if et else None,
+            "location": ev.location,
+            "link": ev.link,
+        })
+    # ETag over the rendered body lets polling clients revalidate with a 304
+    # instead of re-downloading the listing every page load.
+    response = ORJSONResponse(out)
+    etag = hashlib.md5(response.body).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @app.delete("/events/{event_id}")
-def delete_event(event_id: int, session: Session = Depends(get_session)):
-    event = session.get(Event, event_id)
-    if not event:
+def delete_event(event_id: int, session: Session = Depends(get_write_session)):
+    deleted = session.exec(delete(Event).where(Event.id == event_id).returning(Event.id)).first()
+    if not deleted:
         raise HTTPException(status_code=404, detail="Event not found")
-    session.delete(event)
     session.commit()
     return {"ok": True}
 
 
 @app.put("/events/{event_id}", response_model=EventRead)
-def update_event(event_id: int, event_in: EventCreate, session: Session = Depends(get_session)):
+def update_event(event_id: int, event_in: EventCreate, response: Response, session: Session = Depends(get_write_session)):
     """Replace an event's data. Expects full Event body (PUT semantics).
 
     The `id` in the path is authoritative; any `id` in the body is ignored.
     """
+    response.headers["Cache-Control"] = "no-cache"
     event = session.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -380,20 +557,21 @@ def update_event(event_id: int, event_in: EventCreate, session: Session = Depend
     if event_in.duration_minutes <= 0:
         raise HTTPException(status_code=400, detail="`duration_minutes` must be a positive integer")
 
-    # Resolve or create event type
+    # Resolve event type from the process-memory cache
     et_id = None
+    type_name = None
+    type_color = None
     if event_in.event_type_id is not None:
-        et = session.get(EventType, event_in.event_type_id)
+        et = _event_type_by_id(event_in.event_type_id)
         if not et:
             raise HTTPException(status_code=400, detail="event_type_id not found")
-        et_id = et.id
+        et_id, type_name, type_color = et
     elif event_in.event_type:
-        stmt = select(EventType).where(EventType.name == event_in.event_type)
-        et = session.exec(stmt).first()
+        et = _event_type_by_name(event_in.event_type)
         if not et:
             # Do not auto-create types on update either
             raise HTTPException(status_code=400, detail="event_type not found; create it via /event-types first")
-        et_id = et.id
+        et_id, type_name, type_color = et
 
     # Update fields (ignore any body.id)
     event.title = event_in.title
@@ -409,30 +587,43 @@ def update_event(event_id: int, event_in: EventCreate, session: Session = Depend
     session.commit()
     session.refresh(event)
 
-    type_name = None
-    type_color = None
-    if event.event_type_id:
-        et = session.get(EventType, event.event_type_id)
-        type_name = et.name if et else None
-        type_color = et.color if et else None
     return EventRead(id=event.id, title=event.title, description=event.description, date=event.date, start_time=event.start_time, duration_minutes=event.duration_minutes, event_type_id=event.event_type_id, event_type_name=type_name, event_type_color=type_color, location=event.location, link=event.link)
 
 
+# Process-local cache for the type listing: (expiry, rows). Duplicate polls
+# from different clients are served from memory without touching the database.
+_EVENT_TYPES_TTL = 60.0
+_event_types_cache = None
+
+
 @app.get("/event-types", response_model=List[EventType])
-def list_event_types(session: Session = Depends(get_session)):
-    return session.exec(select(EventType)).all()
+def list_event_types(response: Response, session: Session = Depends(get_read_session)):
+    global _event_types_cache
+    # Types change rarely; let browsers reuse them for a few minutes
+    response.headers["Cache-Control"] = "public, max-age=300"
+    now = time_mod.monotonic()
+    if _event_types_cache and now < _event_types_cache[0]:
+        return _event_types_cache[1]
+    rows = [{"id": et.id, "name": et.name, "color": et.color} for et in session.exec(select(EventType)).all()]
+    _event_types_cache = (now + _EVENT_TYPES_TTL, rows)
+    return rows
 
 
 @app.post("/event-types", response_model=EventType)
-def create_event_type(event_type: EventType, session: Session = Depends(get_session)):
+def create_event_type(event_type: EventType, response: Response, session: Session = Depends(get_write_session)):
+    response.headers["Cache-Control"] = "no-cache"
     # allow frontend to add new types; ensure name uniqueness
-    stmt = select(EventType).where(EventType.name == event_type.name)
-    existing = session.exec(stmt).first()
+    existing = session.exec(_SEL_ET_BY_NAME, params={"name": event_type.name}).first()
     if existing:
         raise HTTPException(status_code=400, detail="event type already exists")
     session.add(event_type)
     session.commit()
     session.refresh(event_type)
+    # Drop cached lookups (including cached misses for this name)
+    _event_type_by_id.cache_clear()
+    _event_type_by_name.cache_clear()
+    global _event_types_cache
+    _event_types_cache = None
     return event_type
 
 
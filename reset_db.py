@@ -4,10 +4,11 @@ import datetime
 import sys
 from datetime import date, time
 
+from sqlalchemy import insert
 from sqlmodel import create_engine, Session, select, SQLModel
 
 # Import Event and EventType and DATABASE_URL from main so models are registered
-from main import Event, EventType, DATABASE_URL
+from main import Event, EventType, DATABASE_URL, configure_write_engine
 
 
 def backup_db(db_path: Path) -> Path:
@@ -20,6 +21,7 @@ def backup_db(db_path: Path) -> Path:
 def reset_database():
     db_path = Path("./calendar.db")
     engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    configure_write_engine(engine)
 
     if db_path.exists():
         bak = backup_db(db_path)
@@ -38,12 +40,10 @@ def reset_database():
         ("Outreach", "#f1c40f"),
         ("Other", "#95a5a6"),
     ]
-    with Session(engine) as session:
-        for name, color in default_types:
-            stmt = select(EventType).where(EventType.name == name)
-            if not session.exec(stmt).first():
-                session.add(EventType(name=name, color=color))
-        session.commit()
+    # The database is fresh at this point, so a single multi-row INSERT is
+    # enough -- no per-row existence checks.
+    with Session(engine) as session, session.begin():
+        session.exec(insert(EventType).values([{"name": n, "color": c} for n, c in default_types]))
     print("Seeded default event types: ", [n for n, _ in default_types])
 
     # Optionally seed some sample events for testing when --sample or -s is passed
@@ -71,25 +71,29 @@ def reset_database():
             },
         ]
 
-        with Session(engine) as session:
+        with Session(engine) as session, session.begin():
+            # Resolve every referenced type in one IN query, then insert all
+            # sample events as a single batch.
+            type_names = {s["type"] for s in sample_events}
+            et_ids = {et.name: et.id for et in session.exec(select(EventType).where(EventType.name.in_(type_names))).all()}
+            rows = []
             for s in sample_events:
-                stmt = select(EventType).where(EventType.name == s["type"])
-                et = session.exec(stmt).first()
-                if not et:
+                et_id = et_ids.get(s["type"])
+                if et_id is None:
                     print(f"Skipping sample event; event type not found: {s['type']}")
                     continue
-                ev = Event(
-                    title=s.get("title", s["description"]),
-                    description=s["description"],
-                    date=date.fromisoformat(s["date"]),
-                    start_time=time.fromisoformat(s["start_time"]),
-                    duration_minutes=s.get("duration_minutes", 60),
-                    event_type_id=et.id,
-                    location=s.get("location"),
-                    link=s.get("link"),
-                )
-                session.add(ev)
-            session.commit()
+                rows.append({
+                    "title": s.get("title", s["description"]),
+                    "description": s["description"],
+                    "date": date.fromisoformat(s["date"]),
+                    "start_time": time.fromisoformat(s["start_time"]),
+                    "duration_minutes": s.get("duration_minutes", 60),
+                    "event_type_id": et_id,
+                    "location": s.get("location"),
+                    "link": s.get("link"),
+                })
+            if rows:
+                session.exec(insert(Event).values(rows))
         print("Seeded sample events")
 
 
@@ -13,10 +13,12 @@ This script:
 import csv
 import sys
 from pathlib import Path
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import create_engine, Session, select
 
 # Import User model and DATABASE_URL from main
-from main import User, DATABASE_URL
+from main import User, DATABASE_URL, configure_write_engine
 
 
 def load_csv_users(csv_path: Path) -> dict[int, dict]:
@@ -66,6 +68,7 @@ def sync_users(csv_path: Path = Path("./users.csv")):
     
     print("Loading users from database...")
     engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    configure_write_engine(engine)
     db_users = load_db_users(engine)
     print(f"  Found {len(db_users)} users in database")
     
@@ -112,70 +115,52 @@ def sync_users(csv_path: Path = Path("./users.csv")):
     # Now sync: delete DB-only users, update all CSV users
     print("\n=== SYNC PHASE ===")
     
-    with Session(engine) as session:
-        # Delete users that are in DB but not in CSV
+    # One BEGIN IMMEDIATE transaction (and one fsync) for the whole sync
+    with Session(engine) as session, session.begin():
+        # Delete users that are in DB but not in CSV -- one statement
         if db_only:
             print(f"\nDeleting {len(db_only)} user(s) not in CSV...")
             for user_id in sorted(db_only):
-                user = session.get(User, user_id)
-                if user:
-                    print(f"  Deleting user ID {user_id}: {user.name}")
-                    session.delete(user)
-            session.commit()
+                print(f"  Deleting user ID {user_id}: {db_users[user_id]['name']}")
+            session.exec(delete(User).where(User.id.in_(db_only)))
             print(f"[OK] Deleted {len(db_only)} user(s)")
         
-        # Update or insert users from CSV
+        # Report changes by diffing the dicts already in memory (no per-row
+        # SELECTs), then upsert the whole CSV batch in a single statement.
         updates_count = 0
         inserts_count = 0
         
         print(f"\nSyncing {len(csv_users)} users from CSV...")
         for user_id in sorted(csv_users.keys()):
             csv_user = csv_users[user_id]
-            db_user = session.get(User, user_id)
+            db_user = db_users.get(user_id)
             
-            if db_user:
-                # Update existing user if any field differs
-                changed = False
-                changes = []
-                
-                if db_user.name != csv_user['name']:
-                    changes.append(f"name: '{db_user.name}' -> '{csv_user['name']}'")
-                    db_user.name = csv_user['name']
-                    changed = True
-                
-                if db_user.type != csv_user['type']:
-                    changes.append(f"type: '{db_user.type}' -> '{csv_user['type']}'")
-                    db_user.type = csv_user['type']
-                    changed = True
-                
-                if db_user.role != csv_user['role']:
-                    changes.append(f"role: '{db_user.role}' -> '{csv_user['role']}'")
-                    db_user.role = csv_user['role']
-                    changed = True
-                
-                if db_user.active != csv_user['active']:
-                    changes.append(f"active: {db_user.active} -> {csv_user['active']}")
-                    db_user.active = csv_user['active']
-                    changed = True
-                
-                if changed:
-                    session.add(db_user)
-                    updates_count += 1
-                    print(f"  Updated user ID {user_id} ({csv_user['name']}): {', '.join(changes)}")
-            else:
-                # Insert new user
-                new_user = User(
-                    id=csv_user['id'],
-                    name=csv_user['name'],
-                    type=csv_user['type'],
-                    role=csv_user['role'],
-                    active=csv_user['active']
-                )
-                session.add(new_user)
+            if db_user is None:
                 inserts_count += 1
-                print(f"  Inserted user ID {user_id}: {csv_user['name']}")
+                print(f"  Inserting user ID {user_id}: {csv_user['name']}")
+            else:
+                changes = [
+                    f"{field}: {db_user[field]!r} -> {csv_user[field]!r}"
+                    for field in ('name', 'type', 'role', 'active')
+                    if db_user[field] != csv_user[field]
+                ]
+                if changes:
+                    updates_count += 1
+                    print(f"  Updating user ID {user_id} ({csv_user['name']}): {', '.join(changes)}")
         
-        session.commit()
+        rows = [csv_users[user_id] for user_id in sorted(csv_users.keys())]
+        if rows:
+            stmt = sqlite_insert(User).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "type": stmt.excluded.type,
+                    "role": stmt.excluded.role,
+                    "active": stmt.excluded.active,
+                },
+            )
+            session.exec(stmt)
         
         if updates_count > 0:
             print(f"\n[OK] Updated {updates_count} user(s)")